@@ -9,14 +9,16 @@ pip install PySide6 sounddevice soundfile cmake
 echo "Telepítem a sentencepiece csomagot..."
 pip install sentencepiece
 
-echo "Telepítem az openai-whisper csomagot..."
-pip install -U openai-whisper
+echo "Telepítem a faster-whisper csomagot..."
+pip install -U "faster-whisper>=1.2"
 
 echo "Telepítem a googletrans 4.0.0-rc1 verzióját..."
 pip install googletrans==4.0.0-rc1
 
-echo "Telepítem a PyTorch CUDA 11.7 verzióját..."
-pip install torch torchvision torchaudio --index-url https://download.pytorch.org/whl/cu117
+echo "Telepítem a CUDA 12 cuBLAS és cuDNN 9 könyvtárakat (CTranslate2 GPU-hoz)..."
+pip install nvidia-cublas-cu12 "nvidia-cudnn-cu12==9.*"
+echo "Ha a libcublas.so.12 / libcudnn nem található, futtatás előtt:"
+echo '  export LD_LIBRARY_PATH=$(python3 -c "import os, nvidia.cublas.lib, nvidia.cudnn.lib; print(os.path.dirname(nvidia.cublas.lib.__file__) + \":\" + os.path.dirname(nvidia.cudnn.lib.__file__))")'
 
 echo "Telepítem a numpy < 2 verziót..."
 pip install "numpy<2"
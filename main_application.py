@@ -2,10 +2,40 @@ import sys
 import time
 import threading
 from PySide6 import QtWidgets
-from PySide6.QtCore import Slot
+from PySide6.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, Signal, Slot
 
 from modules.devices import list_input_devices
-from modules.stt_worker import STTWorker
+from modules.stt_worker import STTWorker, default_device, supported_compute_types
+
+
+class WorkerLoaderSignals(QObject):
+
+    loaded = Signal(object)  # STTWorker
+    failed = Signal(str)
+
+
+class WorkerLoader(QRunnable):
+
+    def __init__(self, model_name, compute_type, **worker_kwargs):
+        super().__init__()
+        self.model_name = model_name
+        self.compute_type = compute_type
+        self.worker_kwargs = worker_kwargs
+        self.signals = WorkerLoaderSignals()
+
+    def run(self):
+        try:
+            # STTWorker resolves the model name and loads it through the shared model cache.
+            worker = STTWorker(whisper_model_name=self.model_name,
+                               compute_type=self.compute_type,
+                               **self.worker_kwargs)
+        except Exception as e:
+            self.signals.failed.emit(f"Worker init error: {e}")
+            return
+
+        # The pool thread does not run an event loop, hand the worker to the GUI thread.
+        worker.moveToThread(QCoreApplication.instance().thread())
+        self.signals.loaded.emit(worker)
 
 
 class MainWindow(QtWidgets.QWidget):
@@ -36,6 +66,13 @@ class MainWindow(QtWidgets.QWidget):
         self.model_combo.setCurrentText("small")
         self.layout.addWidget(self.model_combo)
 
+        self.layout.addWidget(QtWidgets.QLabel("Please select the quantization (compute type):"))
+        self.compute_combo = QtWidgets.QComboBox()
+        self.compute_combo.addItem("auto (int8 on CPU, float16 on CUDA if supported)", None)
+        for c in supported_compute_types(default_device()):
+            self.compute_combo.addItem(c, c)
+        self.layout.addWidget(self.compute_combo)
+
         row = QtWidgets.QHBoxLayout()
         self.start_btn = QtWidgets.QPushButton("Start")
         self.stop_btn = QtWidgets.QPushButton("Stop")
@@ -48,13 +85,15 @@ class MainWindow(QtWidgets.QWidget):
         self.layout.addWidget(self.status_label)
 
         self.layout.addWidget(QtWidgets.QLabel("Recognized word/text:"))
-        self.orig_text = QtWidgets.QTextEdit()
+        self.orig_text = QtWidgets.QPlainTextEdit()
         self.orig_text.setReadOnly(True)
+        self.orig_text.setMaximumBlockCount(500)
         self.layout.addWidget(self.orig_text, 3)
 
         self.layout.addWidget(QtWidgets.QLabel("Translated recognized word/text:"))
-        self.trans_text = QtWidgets.QTextEdit()
+        self.trans_text = QtWidgets.QPlainTextEdit()
         self.trans_text.setReadOnly(True)
+        self.trans_text.setMaximumBlockCount(500)
         self.layout.addWidget(self.trans_text, 2)
 
         self.start_btn.clicked.connect(self.start_listening)
@@ -62,6 +101,8 @@ class MainWindow(QtWidgets.QWidget):
 
         self.worker = None
         self._worker_thread = None
+        self._loader = None
+        self._result_times = {}
 
     @Slot()
     def start_listening(self):
@@ -72,44 +113,85 @@ class MainWindow(QtWidgets.QWidget):
         device_index = self.dev_combo.currentData()
         model_lang = self.lang_combo.currentData()
         model_size = self.model_combo.currentText()
+        compute_type = self.compute_combo.currentData()
 
-        try:
-            self.worker = STTWorker(device_index=device_index,
+        self._release_worker()
+        self._result_times.clear()
+        self._loader = WorkerLoader(model_size, compute_type,
+                                    device_index=device_index,
                                     model_lang=model_lang,
-                                    whisper_model_name=model_size,
                                     buffer_seconds=6.0,
                                     transcribe_interval=1.0)
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Error", f"Worker init error: {e}")
-            return
+        self._loader.signals.loaded.connect(self.on_worker_loaded)
+        self._loader.signals.failed.connect(self.on_worker_failed)
 
+        self.start_btn.setEnabled(False)
+        self.stop_btn.setEnabled(False)
+        self.status_label.setText("Loading model…")
+        QThreadPool.globalInstance().start(self._loader)
+
+    @Slot(object)
+    def on_worker_loaded(self, worker):
+        self._release_worker()
+        self.worker = worker
         self.worker.new_result.connect(self.on_new_result)
+        self.worker.translation_ready.connect(self.on_translation_ready)
         self.worker.status.connect(lambda s: self.status_label.setText(s))
         self.worker.error.connect(lambda e: QtWidgets.QMessageBox.critical(self, "Worker error", e))
 
         self._worker_thread = threading.Thread(target=self.worker.start, daemon=True)
         self._worker_thread.start()
 
-        self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         self.status_label.setText("Started...")
 
+    @Slot(str)
+    def on_worker_failed(self, message):
+        QtWidgets.QMessageBox.critical(self, "Error", message)
+        self.start_btn.setEnabled(True)
+        self.status_label.setText(None)
+
+    def _release_worker(self):
+        # Stop and detach the worker; translations it still owes are marked as unavailable here.
+        if self.worker is None:
+            return
+        self.worker.stop()
+        for signal in (self.worker.new_result, self.worker.translation_ready,
+                       self.worker.status, self.worker.error):
+            try:
+                signal.disconnect()
+            except (RuntimeError, TypeError):
+                pass
+        self.worker = None
+        for timestamp in self._result_times.values():
+            self.trans_text.appendPlainText(f"[{timestamp}] → (Translation not available)")
+        self._result_times.clear()
+
     @Slot()
     def stop_listening(self):
-        if self.worker:
-            self.worker.stop()
+        self._release_worker()
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.status_label.setText("Stopped.")
 
-    @Slot(str, str, str)
-    def on_new_result(self, original, src, translated):
+    @Slot(int, str, str)
+    def on_new_result(self, result_id, original, src):
+        if self.sender() is not self.worker:
+            return
         timestamp = time.strftime("%H:%M:%S")
-        self.orig_text.append(f"[{timestamp}] [{src}] {original}")
+        self._result_times[result_id] = timestamp
+        if original:
+            self.orig_text.appendPlainText(f"[{timestamp}] [{src}] {original}")
+
+    @Slot(int, str)
+    def on_translation_ready(self, result_id, translated):
+        if self.sender() is not self.worker:
+            return
+        timestamp = self._result_times.pop(result_id, None) or time.strftime("%H:%M:%S")
         if translated:
-            self.trans_text.append(f"[{timestamp}] → {translated}")
+            self.trans_text.appendPlainText(f"[{timestamp}] → {translated}")
         else:
-            self.trans_text.append(f"[{timestamp}] → (Translation not available)")
+            self.trans_text.appendPlainText(f"[{timestamp}] → (Translation not available)")
 
     def closeEvent(self, event):
         try:
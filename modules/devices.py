@@ -1,9 +1,13 @@
+import functools
+
 import sounddevice as sd
 
+@functools.lru_cache(maxsize=1)
 def list_input_devices():
     devs = sd.query_devices()
-    input_devs = []
-    for i, d in enumerate(devs):
-        if d['max_input_channels'] > 0:
-            input_devs.append({'index': i, 'name': d['name'], 'max_input_channels': d['max_input_channels']})
-    return input_devs
+    return tuple({'index': i, 'name': d['name'], 'max_input_channels': d['max_input_channels']}
+                 for i, d in enumerate(devs) if d['max_input_channels'] > 0)
+
+def invalidate():
+    """Forget the cached device list, e.g. after a device was plugged in or removed."""
+    list_input_devices.cache_clear()
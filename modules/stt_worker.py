@@ -3,11 +3,12 @@ import queue
 import threading
 import numpy as np
 import sounddevice as sd
-import torch
 from PySide6.QtCore import QObject, Signal
 
 try:
-    import whisper
+    import ctranslate2
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
 
     WHISPER_AVAILABLE = True
 except Exception as e:
@@ -18,60 +19,131 @@ from translator import TranslatorWrapper
 
 SAMPLE_RATE = 16000
 CHANNELS = 1
+BLOCK_SIZE = 4096
+SILENCE_RMS = 1e-3  # about -60 dBFS
+COMPUTE_TYPES = ["int8", "int8_float16", "float16"]
+ENGLISH_ONLY_MODELS = {"tiny", "base", "small", "medium"}
+
+
+def default_device():
+    if WHISPER_AVAILABLE and ctranslate2.get_cuda_device_count() > 0:
+        return "cuda"
+    return "cpu"
+
+
+def resolve_model_name(model_name, model_lang):
+    if model_lang == "en" and model_name in ENGLISH_ONLY_MODELS:
+        return model_name + ".en"
+    return model_name
+
+
+def default_compute_type(device):
+    preferred = ("float16", "int8_float16", "int8", "float32") if device == "cuda" else ("int8", "float32")
+    supported = ctranslate2.get_supported_compute_types(device) if WHISPER_AVAILABLE else preferred
+    return next((c for c in preferred if c in supported), "default")
+
+
+def supported_compute_types(device):
+    if not WHISPER_AVAILABLE:
+        return list(COMPUTE_TYPES)
+    supported = ctranslate2.get_supported_compute_types(device)
+    return [c for c in COMPUTE_TYPES if c in supported]
+
+
+_loaded_models = {}  # at most one loaded model
+
+
+def load_whisper_model(model_name, device, compute_type):
+    if not WHISPER_AVAILABLE:
+        raise RuntimeError("Whisper library not installed (pip install faster-whisper).")
+    key = (model_name, device, compute_type)
+    if key not in _loaded_models:
+        _loaded_models.clear()
+        _loaded_models[key] = WhisperModel(model_name, device=device, compute_type=compute_type)
+    return _loaded_models[key]
 
 
 class STTWorker(QObject):
 
-    new_result = Signal(str, str, str)  # original, src_lang, translated
+    new_result = Signal(int, str, str)  # result_id, original, src_lang
+    translation_ready = Signal(int, str)  # result_id, translated
     status = Signal(str)
     error = Signal(str)
 
     def __init__(self, device_index, model_lang, whisper_model_name="small",
-                 buffer_seconds=6.0, transcribe_interval=1.0, parent=None):
+                 buffer_seconds=6.0, transcribe_interval=1.0, compute_type=None, parent=None):
         super().__init__(parent)
         self.device_index = device_index
         self.model_lang = model_lang
-        self.model_name = whisper_model_name
+        self.model_name = resolve_model_name(whisper_model_name, model_lang)
         self.buffer_seconds = float(buffer_seconds)
         self.transcribe_interval = float(transcribe_interval)
+        self.compute_type = compute_type
 
         self._running = False
-        self._audio_q = queue.Queue()
+        self._stop_event = threading.Event()
+        self._window_samples = int(self.buffer_seconds * SAMPLE_RATE)
+        self._ring = np.zeros(self._window_samples + 2 * BLOCK_SIZE, dtype=np.float32)
+        self._write_total = 0
+        self._last_end = 0
+        # Separate prompts, so English translate output never prompts Hungarian transcription.
+        self._prev_text = {"transcribe": "", "translate": ""}
+        self._trans_q = queue.Queue()
+        self._result_id = 0
         self._stream = None
         self._worker_thread = None
+        self._translator_thread = None
 
         if not WHISPER_AVAILABLE:
-            raise RuntimeError("Whisper library not installed (pip install openai-whisper).")
+            raise RuntimeError("Whisper library not installed (pip install faster-whisper).")
 
         try:
             self.status.emit("Loading Whisper model...")
-            device = "cuda" if torch.cuda.is_available() else "cpu"
-            self.model = whisper.load_model(self.model_name, device=device)
-            self.status.emit(f"Whisper '{self.model_name}' loaded on {device}.")
+            device = default_device()
+            if self.compute_type is None:
+                self.compute_type = default_compute_type(device)
+            self.model = load_whisper_model(self.model_name, device, self.compute_type)
+            self.status.emit(f"Whisper '{self.model_name}' ({self.compute_type}) loaded on {device}.")
         except Exception as e:
             raise RuntimeError(f"Error during the load Whisper model: {e}")
 
+        self.batched = BatchedInferencePipeline(model=self.model)
+        self._decode_opts = dict(beam_size=1)
+        self._src = "hu" if self.model_lang == "hu" else "en"
+        self._transcribe_opts = dict(self._decode_opts, language=self._src, task="transcribe")
+        self._translate_opts = dict(self._transcribe_opts, task="translate")
+        self.vad_options = VadOptions(min_silence_duration_ms=500)
         self.translator = TranslatorWrapper()
 
     def _audio_callback(self, indata, frames, time_info, status):
         if status:
             print("Audio callback status:", status, flush=True)
-        try:
-            self._audio_q.put_nowait(indata.copy())
-        except queue.Full:
-            pass
+        size = self._ring.shape[0]
+        pos = self._write_total % size
+        end = pos + frames
+        if end <= size:
+            np.copyto(self._ring[pos:end], indata[:, 0])
+        else:
+            split = size - pos
+            np.copyto(self._ring[pos:], indata[:split, 0])
+            np.copyto(self._ring[:frames - split], indata[split:, 0])
+        self._write_total += frames
 
     def start(self):
         if self._running:
             return
         self._running = True
+        self._stop_event.clear()
+        self._write_total = 0
+        self._last_end = 0
+        self._prev_text = {"transcribe": "", "translate": ""}
         try:
             self._stream = sd.InputStream(samplerate=SAMPLE_RATE,
                                           channels=CHANNELS,
-                                          dtype='int16',
+                                          dtype='float32',
                                           device=self.device_index,
                                           callback=self._audio_callback,
-                                          blocksize=1024)
+                                          blocksize=BLOCK_SIZE)
             self._stream.start()
         except Exception as e:
             self.error.emit(f"Audio input stream error: {e}")
@@ -80,10 +152,13 @@ class STTWorker(QObject):
 
         self._worker_thread = threading.Thread(target=self._process_loop, daemon=True)
         self._worker_thread.start()
+        self._translator_thread = threading.Thread(target=self._translate_loop, daemon=True)
+        self._translator_thread.start()
         self.status.emit("Listening (streaming)...")
 
     def stop(self):
         self._running = False
+        self._stop_event.set()
         try:
             if self._stream is not None:
                 self._stream.stop()
@@ -93,61 +168,96 @@ class STTWorker(QObject):
             pass
         self.status.emit("Stopped.")
 
+    def _transcribe(self, audio, clips, opts, prompt=None):
+        segments, _info = self.batched.transcribe(audio, clip_timestamps=clips,
+                                                  initial_prompt=prompt or None, **opts)
+        return "".join(s.text for s in segments).strip()
+
+    def _next_result_id(self):
+        self._result_id += 1
+        return self._result_id
+
+    def _translate_loop(self):
+        while self._running:
+            try:
+                result_id, original, src, audio, clips = self._trans_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            try:
+                translated = self.translator.translate(original, src)
+                if not translated and src == "hu":
+                    translated = self._transcribe(audio, clips, self._translate_opts)
+            except Exception as e:
+                print("Translate error:", e, flush=True)
+                translated = None
+            self.translation_ready.emit(result_id, translated or "")
+
+    def _ring_snapshot(self, since=0):
+        total = self._write_total
+        n = min(total - since, self._window_samples)
+        size = self._ring.shape[0]
+        start = (total - n) % size
+        end = start + n
+        if end <= size:
+            return self._ring[start:end].copy(), total
+        return np.concatenate((self._ring[start:], self._ring[:end - size])), total
+
     def _process_loop(self):
-        buffer = np.zeros((0,), dtype=np.float32)
-        max_samples = int(self.buffer_seconds * SAMPLE_RATE)
         last_transcribe = 0.0
 
         try:
             while self._running:
-                pulled = False
-                while True:
-                    try:
-                        block = self._audio_q.get_nowait()
-                        pulled = True
-                        block_f = block.astype(np.float32).reshape(-1) / 32768.0
-                        buffer = np.concatenate((buffer, block_f))
-                        if buffer.shape[0] > max_samples:
-                            buffer = buffer[-max_samples:]
-                    except queue.Empty:
-                        break
-
                 now = time.monotonic()
-                if (now - last_transcribe) >= self.transcribe_interval and buffer.shape[0] > SAMPLE_RATE * 0.5:
-                    audio_for_model = buffer.copy()
+                new_samples = self._write_total - self._last_end
+                if (now - last_transcribe) >= self.transcribe_interval and new_samples > SAMPLE_RATE * 0.5:
+                    audio_for_model, total = self._ring_snapshot(self._last_end)
                     last_transcribe = now
+
+                    if np.sqrt(np.mean(np.square(audio_for_model))) < SILENCE_RMS:
+                        self._last_end = total
+                        continue
+                    speech = get_speech_timestamps(audio_for_model, self.vad_options, sampling_rate=SAMPLE_RATE)
+                    if not speech:
+                        self._last_end = total
+                        continue
+
+                    # Hold back a segment still open at the end of the snapshot, unless it grows too long.
+                    held = audio_for_model.shape[0] - speech[-1]["start"]
+                    if speech[-1]["end"] >= audio_for_model.shape[0] and held < self._window_samples // 2:
+                        self._last_end = total - held
+                        speech = speech[:-1]
+                        if not speech:
+                            continue
+                    else:
+                        self._last_end = total
+                    clips = [{"start": seg["start"] / SAMPLE_RATE, "end": seg["end"] / SAMPLE_RATE}
+                             for seg in speech]
+
                     try:
-                        if self.model_lang == "hu":
-                            res = self.model.transcribe(audio_for_model, language="hu", task="transcribe")
-                            original = (res.get("text") or "").strip()
-                            translated = self.translator.translate(original, "hu")
-                            if not translated:
-                                res2 = self.model.transcribe(audio_for_model, language="hu", task="translate")
-                                translated = (res2.get("text") or "").strip()
-                            src = "hu"
+                        if self.model_lang == "hu" and not self.translator.available():
+                            translated = self._transcribe(audio_for_model, clips, self._translate_opts,
+                                                          prompt=self._prev_text["translate"][-224:])
+                            if translated:
+                                self._prev_text["translate"] = translated
+                                result_id = self._next_result_id()
+                                self.new_result.emit(result_id, "", "hu")
+                                self.translation_ready.emit(result_id, translated)
                         else:
-                            res = self.model.transcribe(audio_for_model, language="en", task="transcribe")
-                            original = (res.get("text") or "").strip()
-                            translated = self.translator.translate(original, "en")
-                            src = "en"
-
-                        if original:
-                            self.new_result.emit(original, src, translated or "")
+                            original = self._transcribe(audio_for_model, clips, self._transcribe_opts,
+                                                        prompt=self._prev_text["transcribe"][-224:])
+                            if original:
+                                self._prev_text["transcribe"] = original
+                                result_id = self._next_result_id()
+                                self.new_result.emit(result_id, original, self._src)
+                                fallback = (audio_for_model, clips) if self._src == "hu" else (None, None)
+                                self._trans_q.put((result_id, original, self._src) + fallback)
 
                     except Exception as e:
                         print("Processing/transcribe error:", e, flush=True)
                         self.error.emit(f"Transcribe error: {e}")
 
-                    try:
-                        if torch.cuda.is_available():
-                            torch.cuda.empty_cache()
-                    except Exception:
-                        pass
-
-                if not pulled:
-                    time.sleep(0.01)
-                else:
-                    time.sleep(0.001)
+                remaining = self.transcribe_interval - (time.monotonic() - last_transcribe)
+                self._stop_event.wait(max(remaining, 0.05))
 
         except Exception as e:
             self.error.emit(str(e))
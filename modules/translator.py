@@ -1,26 +1,46 @@
+import time
+from collections import OrderedDict
+
 try:
     from googletrans import Translator as GoogleTranslator
     GOOGLETRANS_AVAILABLE = True
 except Exception:
     GOOGLETRANS_AVAILABLE = False
 
+GOOGLE_COOLDOWN_SECONDS = 30.0
+
 class TranslatorWrapper:
-    def __init__(self):
+    def __init__(self, cache_size=128):
         self.google = False
+        self.cache_size = cache_size
+        self._google_cooldown_until = 0.0
+        self._cache = OrderedDict()  # (text, src) -> translation, most recently used last
         if GOOGLETRANS_AVAILABLE:
             self.google = True
             self.gtr = GoogleTranslator()
             print("Googletrans available (online fallback).")
 
+    def available(self):
+        # False while googletrans is missing or cooling down after a failed request.
+        return self.google and time.monotonic() >= self._google_cooldown_until
+
     def translate(self, text, src):
         if not text:
             return None
+        key = (text, src)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
         try:
-            if self.google:
+            if self.available():
                 dest = 'hu' if src.startswith('en') else 'en'
                 res = self.gtr.translate(text, src=src, dest=dest)
+                self._cache[key] = res.text
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
                 return res.text
             return None
         except Exception as e:
             print("Translate error:", e)
+            self._google_cooldown_until = time.monotonic() + GOOGLE_COOLDOWN_SECONDS
             return None